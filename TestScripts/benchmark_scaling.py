@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Script to measure how scripts/generate_matter_cluster_json.py scales with cluster size.
+
+For each scale a synthetic cluster is generated with generate_stress_corpus.py, then
+converted to JSON with generate_json_from_xml(). Wall time (best of --repeat runs) and
+peak traced memory are tabulated against the number of XML elements, together with
+the log-log growth exponent between consecutive scales (1.0 = linear, 2.0 = quadratic).
+
+Usage:
+    python3 TestScripts/benchmark_scaling.py [options]
+
+Example:
+    python3 TestScripts/benchmark_scaling.py --scales 250,500,1000,2000 --csv output/scaling.csv
+"""
+
+import argparse
+import contextlib
+import io
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Any, Optional
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+sys.path.insert(0, os.path.join(os.path.dirname(SCRIPT_DIR), 'scripts'))
+
+from generate_stress_corpus import MAX_ELEMENT_IDS, generate_cluster_xml  # noqa: E402
+from generate_matter_cluster_json import generate_json_from_xml  # noqa: E402
+
+
+def run_generator(xml_file: str, json_file: str):
+    """Run the JSON generator once, discarding its progress output."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate_json_from_xml(xml_file, json_file)
+
+
+def measure_scale(scale: int, work_dir: str, repeat: int, seed: int, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate a cluster at the given scale and measure the JSON generator on it."""
+    content, elements = generate_cluster_xml(scale, seed=seed, **options)
+    xml_file = os.path.join(work_dir, f"stress_{scale}.xml")
+    json_file = os.path.join(work_dir, f"stress_{scale}.json")
+    with open(xml_file, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_generator(xml_file, json_file)
+        best = min(best, time.perf_counter() - start)
+
+    # Memory is traced in a separate run so tracing overhead does not skew the timings
+    tracemalloc.start()
+    try:
+        run_generator(xml_file, json_file)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'scale': scale,
+        'elements': elements,
+        'xml_bytes': len(content.encode('utf-8')),
+        'seconds': best,
+        'peak_bytes': peak,
+    }
+
+
+def growth_exponent(prev: Dict[str, Any], curr: Dict[str, Any], key: str) -> Optional[float]:
+    """Return the log-log slope of key against element count between two results."""
+    if prev[key] <= 0 or curr[key] <= 0 or curr['elements'] == prev['elements']:
+        return None
+    return math.log(curr[key] / prev[key]) / math.log(curr['elements'] / prev['elements'])
+
+
+def add_exponents(results: List[Dict[str, Any]]):
+    """Annotate each result with time and memory growth exponents relative to the previous scale."""
+    for prev, curr in zip([None] + results, results):
+        curr['time_exponent'] = growth_exponent(prev, curr, 'seconds') if prev else None
+        curr['memory_exponent'] = growth_exponent(prev, curr, 'peak_bytes') if prev else None
+
+
+def format_exponent(value: Optional[float]) -> str:
+    return '-' if value is None else f"{value:.2f}"
+
+
+def print_table(results: List[Dict[str, Any]]):
+    """Print results as a fixed-width table."""
+    header = f"{'scale':>8} {'elements':>10} {'xml KiB':>10} {'time s':>10} {'us/elem':>9} {'t exp':>6} " \
+             f"{'peak MiB':>10} {'B/elem':>8} {'m exp':>6}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        print(f"{r['scale']:>8} {r['elements']:>10} {r['xml_bytes'] / 1024:>10.1f} {r['seconds']:>10.3f} "
+              f"{r['seconds'] / r['elements'] * 1e6:>9.2f} {format_exponent(r['time_exponent']):>6} "
+              f"{r['peak_bytes'] / (1024 * 1024):>10.2f} {r['peak_bytes'] / r['elements']:>8.0f} "
+              f"{format_exponent(r['memory_exponent']):>6}")
+
+
+def write_csv(results: List[Dict[str, Any]], csv_file: str):
+    """Write raw results to a CSV file for plotting."""
+    import csv
+
+    fields = ['scale', 'elements', 'xml_bytes', 'seconds', 'peak_bytes', 'time_exponent', 'memory_exponent']
+    with open(csv_file, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for r in results:
+            writer.writerow({key: r[key] for key in fields})
+
+
+def parse_scales(value: str) -> List[int]:
+    try:
+        scales = sorted({int(s) for s in value.split(',') if s.strip()})
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid scale list: {value}")
+    if not scales or scales[0] < 1:
+        raise argparse.ArgumentTypeError('scales must be positive integers')
+    if scales[-1] > MAX_ELEMENT_IDS:
+        raise argparse.ArgumentTypeError(f"scales must be at most {MAX_ELEMENT_IDS}")
+    return scales
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Benchmark generate_matter_cluster_json.py against cluster size.')
+    parser.add_argument('--scales', type=parse_scales, default=parse_scales('125,250,500,1000'),
+                        help='Comma-separated attribute counts to benchmark (default: 125,250,500,1000)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per scale; the best is reported (default: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the synthetic corpus (default: 0)')
+    parser.add_argument('--conformance-depth', type=int, default=3,
+                        help='Maximum nesting depth of conformance terms (default: 3)')
+    parser.add_argument('--command-args', choices=['field', 'arg'], default='arg',
+                        help="Element used for command arguments; 'arg' exercises the generator's "
+                             "argument parsing (default: arg)")
+    parser.add_argument('--csv', help='Also write raw results to this CSV file')
+    parser.add_argument('--max-exponent', type=float,
+                        help='Exit with status 1 if the time growth exponent between the two largest '
+                             'scales exceeds this value (e.g. 1.2 to require near-linear scaling)')
+    return parser.parse_args(argv)
+
+
+def main():
+    """Main function."""
+    args = parse_args()
+    options = {'conformance_depth': args.conformance_depth, 'command_args': args.command_args}
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix='matter_stress_') as work_dir:
+        for scale in args.scales:
+            print(f"Benchmarking scale {scale}...", file=sys.stderr)
+            results.append(measure_scale(scale, work_dir, max(args.repeat, 1), args.seed, options))
+
+    add_exponents(results)
+    print_table(results)
+
+    if args.csv:
+        write_csv(results, args.csv)
+        print(f"\nWrote results to: {args.csv}")
+
+    if args.max_exponent is not None and len(results) > 1:
+        exponent = results[-1]['time_exponent']
+        if exponent is not None and exponent > args.max_exponent:
+            print(f"\nError: time growth exponent {exponent:.2f} exceeds --max-exponent {args.max_exponent}",
+                  file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Script to generate a synthetic Matter cluster / device type XML corpus for scaling tests.
+
+The generated files follow the same schema as data/clusters and data/device_types
+(cluster.xsd / devicetype.xsd) but at an arbitrary size: thousands of attributes,
+commands, enums, bitmaps, structs and nested conformance terms. Output is fully
+deterministic for a given seed and scale, so two runs produce byte-identical files.
+
+Usage:
+    python3 TestScripts/generate_stress_corpus.py [options] <output_dir>
+
+Example:
+    python3 TestScripts/generate_stress_corpus.py --scale 5000 output/stress
+"""
+
+import argparse
+import os
+import random
+import sys
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Any, Optional, Tuple
+
+
+# Base types used for attributes and fields that do not reference a generated data type
+BASE_TYPES = ['bool', 'uint8', 'uint16', 'uint32', 'int8', 'int16', 'int32', 'string', 'octstr', 'epoch-s']
+
+# Numeric base types that get a <between> constraint
+NUMERIC_TYPES = {'uint8': 0xFE, 'uint16': 0xFFFE, 'uint32': 0xFFFFFFFE, 'int8': 0x7F, 'int16': 0x7FFF, 'int32': 0x7FFFFFFF}
+
+# Cluster id used for generated clusters (start of the manufacturer-specific range)
+VENDOR_CLUSTER_ID_BASE = 0xFFF1FC00
+
+# Attribute and command ids are formatted as 0x0000-0xEFFF, below the global element range (0xF000+)
+MAX_ELEMENT_IDS = 0xF000
+
+
+def scaled_counts(scale: int) -> Dict[str, int]:
+    """Derive per-element counts from a single scale value (number of attributes)."""
+    scale = max(scale, 1)
+    return {
+        'attributes': scale,
+        'commands': max(scale // 2, 1),
+        'events': max(scale // 8, 1),
+        'enums': max(scale // 4, 1),
+        'bitmaps': max(scale // 8, 1),
+        'structs': max(scale // 8, 1),
+        # FeatureMap is a 32-bit bitmap, so features never grow past 32
+        'features': min(max(scale // 16, 2), 32),
+    }
+
+
+def feature_code(index: int) -> str:
+    """Return a short upper-case feature code for the feature at index."""
+    code = ''
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        code = chr(ord('A') + rem) + code
+    return f"F{code}"
+
+
+class StressCorpusBuilder:
+    """Builds synthetic cluster and device type element trees from a seeded RNG."""
+
+    def __init__(self, counts: Dict[str, int], items_per_type: int = 16, fields_per_struct: int = 8,
+                 fields_per_command: int = 4, conformance_depth: int = 3, command_args: str = 'field',
+                 seed: int = 0):
+        self.counts = counts
+        self.items_per_type = max(items_per_type, 1)
+        self.fields_per_struct = max(fields_per_struct, 1)
+        self.fields_per_command = max(fields_per_command, 0)
+        self.conformance_depth = max(conformance_depth, 0)
+        self.command_args = command_args
+        self.rng = random.Random(seed)
+
+        self.features = [feature_code(i) for i in range(counts['features'])]
+        self.enum_names = [f"StressEnum{i}Enum" for i in range(counts['enums'])]
+        self.bitmap_names = [f"StressBitmap{i}Bitmap" for i in range(counts['bitmaps'])]
+        self.struct_names = [f"StressStruct{i}Struct" for i in range(counts['structs'])]
+
+    # -- conformance -------------------------------------------------------
+
+    def _conformance_term(self, parent: ET.Element, depth: int):
+        """Append a (possibly nested) conformance expression over the generated features."""
+        if depth <= 0 or self.rng.random() < 0.25:
+            ET.SubElement(parent, 'feature', name=self.rng.choice(self.features))
+            return
+        term = self.rng.choice(['orTerm', 'andTerm', 'notTerm'])
+        term_elem = ET.SubElement(parent, term)
+        operands = 1 if term == 'notTerm' else self.rng.randint(2, 3)
+        for _ in range(operands):
+            self._conformance_term(term_elem, depth - 1)
+
+    def _conformance(self, parent: ET.Element):
+        """Append a conformance element (mandatory, optional or otherwise) to parent."""
+        kind = self.rng.random()
+        if kind < 0.3 or self.conformance_depth == 0:
+            ET.SubElement(parent, self.rng.choice(['mandatoryConform', 'optionalConform']))
+        elif kind < 0.7:
+            conform = ET.SubElement(parent, self.rng.choice(['mandatoryConform', 'optionalConform']))
+            self._conformance_term(conform, self.conformance_depth)
+        else:
+            otherwise = ET.SubElement(parent, 'otherwiseConform')
+            mandatory = ET.SubElement(otherwise, 'mandatoryConform')
+            self._conformance_term(mandatory, self.conformance_depth)
+            ET.SubElement(otherwise, 'optionalConform')
+
+    # -- data types --------------------------------------------------------
+
+    def _random_type(self, allow_struct: bool = True) -> str:
+        """Pick a field/attribute type, favouring references to generated data types."""
+        pools = [BASE_TYPES]
+        if self.enum_names:
+            pools.append(self.enum_names)
+        if self.bitmap_names:
+            pools.append(self.bitmap_names)
+        if allow_struct and self.struct_names:
+            pools.append(self.struct_names)
+        return self.rng.choice(self.rng.choice(pools))
+
+    def _constraint(self, parent: ET.Element, type_name: str):
+        """Append a constraint element suited to type_name."""
+        constraint = ET.SubElement(parent, 'constraint')
+        if type_name in NUMERIC_TYPES:
+            between = ET.SubElement(constraint, 'between')
+            ET.SubElement(between, 'from', value='0')
+            ET.SubElement(between, 'to', value=str(self.rng.randint(1, NUMERIC_TYPES[type_name])))
+        elif type_name in ('string', 'octstr'):
+            ET.SubElement(constraint, 'maxLength', value=str(self.rng.choice([16, 32, 64, 254])))
+        else:
+            ET.SubElement(constraint, 'desc')
+
+    def _enum(self, parent: ET.Element, name: str):
+        enum_elem = ET.SubElement(parent, 'enum', name=name)
+        for i in range(self.items_per_type):
+            item = ET.SubElement(enum_elem, 'item', value=str(i), name=f"Value{i}", summary=f"{name} value {i}")
+            self._conformance(item)
+
+    def _bitmap(self, parent: ET.Element, name: str):
+        bitmap_elem = ET.SubElement(parent, 'bitmap', name=name)
+        for i in range(min(self.items_per_type, 32)):
+            bitfield = ET.SubElement(bitmap_elem, 'bitfield', name=f"Bit{i}", bit=str(i), summary=f"{name} bit {i}")
+            self._conformance(bitfield)
+
+    def _struct(self, parent: ET.Element, index: int):
+        struct_elem = ET.SubElement(parent, 'struct', name=self.struct_names[index])
+        for i in range(self.fields_per_struct):
+            # Only reference earlier structs so nesting stays acyclic
+            field_type = self._random_type(allow_struct=False)
+            if index and self.rng.random() < 0.2:
+                field_type = self.struct_names[self.rng.randrange(index)]
+            field = ET.SubElement(struct_elem, 'field', id=str(i), name=f"Field{i}", type=field_type)
+            self._conformance(field)
+
+    # -- cluster -----------------------------------------------------------
+
+    def build_cluster(self, index: int = 0) -> ET.Element:
+        """Build a complete <cluster> element."""
+        cluster_id = f"0x{VENDOR_CLUSTER_ID_BASE + index:08X}"
+        cluster_name = f"Stress Test {index} Cluster"
+        cluster = ET.Element('cluster', {
+            'xmlns:xsi': 'http://www.w3.org/2001/XMLSchema-instance',
+            'xsi:schemaLocation': 'types types.xsd cluster cluster.xsd',
+            'id': cluster_id,
+            'name': cluster_name,
+            'revision': '1',
+        })
+        revision_history = ET.SubElement(cluster, 'revisionHistory')
+        ET.SubElement(revision_history, 'revision', revision='1', summary='Synthetic stress corpus')
+        cluster_ids = ET.SubElement(cluster, 'clusterIds')
+        ET.SubElement(cluster_ids, 'clusterId', id=cluster_id, name=f"Stress Test {index}")
+        ET.SubElement(cluster, 'classification', hierarchy='base', role='application', picsCode='STRS', scope='Endpoint')
+
+        features = ET.SubElement(cluster, 'features')
+        for bit, code in enumerate(self.features):
+            feature = ET.SubElement(features, 'feature', bit=str(bit), code=code, name=f"Feature{code}",
+                                    summary=f"Synthetic feature {code}")
+            if bit and self.rng.random() < 0.5:
+                # Features may only depend on features defined before them
+                conform = ET.SubElement(feature, 'optionalConform')
+                ET.SubElement(conform, 'feature', name=self.features[self.rng.randrange(bit)])
+            else:
+                ET.SubElement(feature, 'optionalConform')
+
+        data_types = ET.SubElement(cluster, 'dataTypes')
+        for name in self.enum_names:
+            self._enum(data_types, name)
+        for name in self.bitmap_names:
+            self._bitmap(data_types, name)
+        for i in range(len(self.struct_names)):
+            self._struct(data_types, i)
+
+        attributes = ET.SubElement(cluster, 'attributes')
+        for i in range(self.counts['attributes']):
+            attr_type = self._random_type()
+            attr = ET.SubElement(attributes, 'attribute', id=f"0x{i:04X}", name=f"StressAttribute{i}", type=attr_type)
+            access = {'read': 'true', 'readPrivilege': 'view'}
+            if self.rng.random() < 0.3:
+                access.update({'write': 'true', 'writePrivilege': 'operate'})
+            ET.SubElement(attr, 'access', access)
+            quality = {}
+            if self.rng.random() < 0.3:
+                quality['nullable'] = 'true'
+            if self.rng.random() < 0.5:
+                quality['reportable'] = 'true'
+            if quality:
+                ET.SubElement(attr, 'quality', quality)
+            self._conformance(attr)
+            self._constraint(attr, attr_type)
+
+        commands = ET.SubElement(cluster, 'commands')
+        for i in range(self.counts['commands']):
+            cmd = ET.SubElement(commands, 'command', id=f"0x{i:04X}", name=f"StressCommand{i}",
+                                direction='commandToServer', response='Y')
+            ET.SubElement(cmd, 'access', invokePrivilege='operate')
+            self._conformance(cmd)
+            for arg_index in range(self.fields_per_command):
+                arg_type = self._random_type()
+                arg = ET.SubElement(cmd, self.command_args, id=str(arg_index), name=f"Arg{arg_index}", type=arg_type)
+                self._conformance(arg)
+
+        events = ET.SubElement(cluster, 'events')
+        for i in range(self.counts['events']):
+            event = ET.SubElement(events, 'event', id=f"0x{i:02X}", name=f"StressEvent{i}",
+                                  priority=self.rng.choice(['debug', 'info', 'critical']))
+            ET.SubElement(event, 'access', readPrivilege='view')
+            self._conformance(event)
+            field = ET.SubElement(event, 'field', id='0', name='Value', type=self._random_type())
+            ET.SubElement(field, 'mandatoryConform')
+
+        return cluster
+
+    # -- device type -------------------------------------------------------
+
+    def build_device_type(self, cluster: ET.Element, index: int = 0) -> ET.Element:
+        """Build a <deviceType> element that requires the given cluster with element-level overrides."""
+        device_type = ET.Element('deviceType', {
+            'xmlns:xsi': 'http://www.w3.org/2001/XMLSchema-instance',
+            'xsi:schemaLocation': 'types types.xsd devicetype devicetype.xsd',
+            'id': f"0xFFF1{index:04X}",
+            'name': f"Stress Test {index} Device",
+            'revision': '1',
+        })
+        revision_history = ET.SubElement(device_type, 'revisionHistory')
+        ET.SubElement(revision_history, 'revision', revision='1', summary='Synthetic stress corpus')
+        ET.SubElement(device_type, 'classification', **{'class': 'simple', 'scope': 'endpoint'})
+
+        clusters = ET.SubElement(device_type, 'clusters')
+        for base_id, base_name in (('0x0003', 'Identify'), ('0x001D', 'Descriptor')):
+            base = ET.SubElement(clusters, 'cluster', id=base_id, name=base_name, side='server')
+            ET.SubElement(base, 'mandatoryConform')
+
+        ref = ET.SubElement(clusters, 'cluster', id=cluster.get('id'), name=cluster.get('name'), side='server')
+        ET.SubElement(ref, 'mandatoryConform')
+
+        features = ET.SubElement(ref, 'features')
+        for code in self.features:
+            if self.rng.random() < 0.5:
+                feature = ET.SubElement(features, 'feature', code=code, name=f"Feature{code}")
+                ET.SubElement(feature, 'mandatoryConform')
+
+        # Override roughly a quarter of the cluster's attributes and commands
+        attributes = ET.SubElement(ref, 'attributes')
+        for attr in cluster.iterfind('attributes/attribute'):
+            if self.rng.random() < 0.25:
+                override = ET.SubElement(attributes, 'attribute', code=attr.get('id'), name=attr.get('name'))
+                self._conformance(override)
+        commands = ET.SubElement(ref, 'commands')
+        for cmd in cluster.iterfind('commands/command'):
+            if self.rng.random() < 0.25:
+                override = ET.SubElement(commands, 'command', id=cmd.get('id'), name=cmd.get('name'))
+                ET.SubElement(override, 'mandatoryConform')
+
+        return device_type
+
+
+def to_xml_string(elem: ET.Element) -> str:
+    """Serialize an element tree with an XML declaration and two-space indentation."""
+    # ET.indent is only available on Python 3.9+; older versions get unindented output
+    if hasattr(ET, 'indent'):
+        ET.indent(elem, space='  ')
+    return '<?xml version="1.0"?>\n' + ET.tostring(elem, encoding='unicode') + '\n'
+
+
+def count_elements(elem: ET.Element) -> int:
+    """Count every element in the tree rooted at elem (including elem)."""
+    return sum(1 for _ in elem.iter())
+
+
+def generate_cluster_xml(scale: int, seed: int = 0, **options: Any) -> Tuple[str, int]:
+    """Generate a single synthetic cluster XML document at the given scale.
+
+    Returns the serialized document and its element count.
+    """
+    builder = StressCorpusBuilder(scaled_counts(scale), seed=seed, **options)
+    cluster = builder.build_cluster()
+    return to_xml_string(cluster), count_elements(cluster)
+
+
+def generate_corpus(output_dir: str, counts: Dict[str, int], clusters: int = 1, seed: int = 0,
+                    **options: Any) -> List[Dict[str, Any]]:
+    """Write cluster and device type XML files to output_dir and return a summary per file."""
+    cluster_dir = os.path.join(output_dir, 'clusters')
+    device_type_dir = os.path.join(output_dir, 'device_types')
+    os.makedirs(cluster_dir, exist_ok=True)
+    os.makedirs(device_type_dir, exist_ok=True)
+
+    summary = []
+    for index in range(clusters):
+        # Each cluster gets its own RNG stream so adding clusters does not change earlier ones
+        builder = StressCorpusBuilder(counts, seed=seed + index, **options)
+        cluster = builder.build_cluster(index)
+        device_type = builder.build_device_type(cluster, index)
+
+        for directory, name, elem in ((cluster_dir, f"StressTest{index}.xml", cluster),
+                                      (device_type_dir, f"StressTest{index}Device.xml", device_type)):
+            path = os.path.join(directory, name)
+            element_count = count_elements(elem)
+            content = to_xml_string(elem)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            summary.append({'path': path, 'elements': element_count, 'bytes': len(content.encode('utf-8'))})
+
+    return summary
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Generate a synthetic Matter XML corpus for scaling tests.')
+    parser.add_argument('output_dir', help='Directory to write clusters/ and device_types/ into')
+    parser.add_argument('--scale', type=int, default=1000,
+                        help='Number of attributes; other element counts are derived from it (default: 1000)')
+    parser.add_argument('--clusters', type=int, default=1, help='Number of cluster/device type pairs (default: 1)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    for name in ('attributes', 'commands', 'events', 'enums', 'bitmaps', 'structs', 'features'):
+        parser.add_argument(f"--{name}", type=int, help=f"Override the derived number of {name}")
+    parser.add_argument('--items-per-type', type=int, default=16, help='Items per enum / bitfields per bitmap (default: 16)')
+    parser.add_argument('--fields-per-struct', type=int, default=8, help='Fields per struct (default: 8)')
+    parser.add_argument('--fields-per-command', type=int, default=4, help='Arguments per command (default: 4)')
+    parser.add_argument('--conformance-depth', type=int, default=3,
+                        help='Maximum nesting depth of orTerm/andTerm/notTerm conformance (default: 3)')
+    parser.add_argument('--command-args', choices=['field', 'arg'], default='field',
+                        help="Element used for command arguments: 'field' (Matter spec XML) or "
+                             "'arg' (ZAP XML, parsed by generate_matter_cluster_json.py) (default: field)")
+    return parser.parse_args(argv)
+
+
+def builder_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """Return the StressCorpusBuilder keyword options selected on the command line."""
+    return {
+        'items_per_type': args.items_per_type,
+        'fields_per_struct': args.fields_per_struct,
+        'fields_per_command': args.fields_per_command,
+        'conformance_depth': args.conformance_depth,
+        'command_args': args.command_args,
+    }
+
+
+def main():
+    """Main function."""
+    args = parse_args()
+
+    counts = scaled_counts(args.scale)
+    for name in counts:
+        value = getattr(args, name)
+        if value is not None:
+            counts[name] = value
+    for name, value in counts.items():
+        if value < 0:
+            print(f"Error: --{name} must not be negative", file=sys.stderr)
+            sys.exit(1)
+    for name in ('attributes', 'commands'):
+        if counts[name] > MAX_ELEMENT_IDS:
+            print(f"Error: --{name} must be at most {MAX_ELEMENT_IDS} (ids must stay below 0x{MAX_ELEMENT_IDS:04X})",
+                  file=sys.stderr)
+            sys.exit(1)
+    if args.clusters < 1:
+        print("Error: --clusters must be at least 1", file=sys.stderr)
+        sys.exit(1)
+    if not 1 <= counts['features'] <= 32:
+        print("Error: --features must be between 1 and 32", file=sys.stderr)
+        sys.exit(1)
+
+    summary = generate_corpus(args.output_dir, counts, clusters=args.clusters, seed=args.seed,
+                              **builder_options(args))
+
+    print(f"Generated {len(summary)} files in {args.output_dir}")
+    print("  - " + ", ".join(f"{name}: {value}" for name, value in counts.items()))
+    for entry in summary:
+        print(f"  - {entry['path']}: {entry['elements']} elements, {entry['bytes']} bytes")
+
+
+if __name__ == '__main__':
+    main()